@@ -0,0 +1,189 @@
+import argparse
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from connect4pyAivAi import Connect4AIvAI, SearchTimeout
+
+
+def search_position(game, depth, search_mode):
+    """Search the position for the side to move and return (column, score)"""
+    player = game.current_player
+    if search_mode == 'pvs':
+        return game.aspiration_search(player, depth)
+    return game.minimax(depth, -sys.maxsize, sys.maxsize, True, player)
+
+
+def iterate_search(game, depths, search_mode):
+    """Search each depth in turn, yielding (depth, column, score) as each finishes"""
+    player = game.current_player
+    if search_mode == 'pvs':
+        yield from game.iterate_pvs(player, depths)
+        return
+    for d in depths:
+        col, score = game.minimax(d, -sys.maxsize, sys.maxsize, True, player)
+        yield d, col, score
+
+
+def evaluate_position(game, depth, time_budget, search_mode):
+    """Evaluate a position to a fixed depth, or deepen until the time budget is spent.
+
+    With a time budget the search deepens two plies at a time over even
+    depths, so scores stay comparable between moves, and reports the last
+    depth that finished. The first, shallowest iteration always completes;
+    after that an iteration still running when the budget is spent is
+    aborted and thrown away.
+    """
+    if depth < 1:
+        raise ValueError(f"search depth must be at least 1, got {depth}")
+    if time_budget is None:
+        col, score = search_position(game, depth, search_mode)
+        return col, score, depth
+
+    empty_cells = sum(row.count(' ') for row in game.board)
+    first = 2 if empty_cells >= 2 else 1
+    board = [row[:] for row in game.board]
+    player = game.current_player
+    deadline = time.perf_counter() + time_budget
+    try:
+        for searched, col, score in iterate_search(game, range(first, empty_cells + 1, 2), search_mode):
+            game.deadline = deadline
+            if time.perf_counter() >= deadline:
+                break
+    except SearchTimeout:
+        # The aborted search left its moves on the board
+        game.board = board
+        game.current_player = player
+    finally:
+        game.deadline = None
+    return col, score, searched
+
+
+def analyze_game(record, depth=4, time_budget=None, search_mode='pvs'):
+    """Replay a game record and annotate every move.
+
+    Each move gets the engine's preferred column and the score of the
+    position before the move, from the point of view of the player to move.
+    Columns are numbered 1-7 as in the record. Problems with a record are
+    reported in its "error" field rather than raised.
+    """
+    result = {"game": record, "moves": []}
+    try:
+        replay_game(record, result, depth, time_budget, search_mode)
+    except Exception as e:
+        result["error"] = f"analysis failed: {e}"
+    return result
+
+
+def replay_game(record, result, depth, time_budget, search_mode):
+    """Play the record move by move, appending annotations to result"""
+    game = Connect4AIvAI()
+
+    for ply, move in enumerate(record, 1):
+        if move not in "1234567":
+            result["error"] = f"invalid column '{move}' at move {ply}"
+            return
+        if game.is_terminal_state():
+            result["error"] = f"move {ply} played after the game ended"
+            return
+
+        col = int(move) - 1
+        if col not in game.get_valid_columns():
+            result["error"] = f"column {move} is full at move {ply}"
+            return
+
+        best_col, score, searched = evaluate_position(game, depth, time_budget, search_mode)
+        result["moves"].append({
+            "ply": ply,
+            "player": game.current_player,
+            "move": col + 1,
+            "best": best_col + 1,
+            "score": score,
+            "depth": searched,
+        })
+
+        game.drop_piece(col)
+        if game.check_winner():
+            result["winner"] = game.current_player
+        elif not game.is_board_full():
+            game.switch_player()
+
+
+def read_records(stream):
+    """Yield one game record per non-empty line"""
+    for line in stream:
+        record = line.strip()
+        if record:
+            yield record
+
+
+def analyze_stream(records, output, workers, depth=4, time_budget=None, search_mode='pvs'):
+    """Analyze records and write one JSON line per game, in input order.
+
+    At most a few games per worker are in flight at once, so memory stays
+    bounded however long the input is.
+    """
+    if workers <= 1:
+        for record in records:
+            result = analyze_game(record, depth, time_budget, search_mode)
+            output.write(json.dumps(result) + "\n")
+        return
+
+    max_pending = workers * 4
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for record in records:
+            pending.append(executor.submit(analyze_game, record, depth, time_budget, search_mode))
+            if len(pending) >= max_pending:
+                output.write(json.dumps(pending.popleft().result()) + "\n")
+        while pending:
+            output.write(json.dumps(pending.popleft().result()) + "\n")
+
+
+def positive_int(text):
+    """argparse type for an integer of at least 1"""
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+
+def positive_float(text):
+    """argparse type for a number greater than 0"""
+    value = float(text)
+    if value <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {value}")
+    return value
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Annotate Connect 4 game records with engine evaluations.")
+    parser.add_argument("input", nargs="?", default="-",
+                        help="file with one move sequence per line, e.g. 4453 (default: stdin)")
+    parser.add_argument("-o", "--output", default="-", help="output file (default: stdout)")
+    parser.add_argument("-d", "--depth", type=positive_int, default=4, help="search depth per position (default: 4)")
+    parser.add_argument("-t", "--time", type=positive_float, default=None,
+                        help="seconds per position; deepens until spent instead of using --depth")
+    parser.add_argument("-w", "--workers", type=positive_int, default=os.cpu_count() or 1,
+                        help="worker processes (default: number of CPUs)")
+    parser.add_argument("--search", choices=["alphabeta", "pvs"], default="pvs",
+                        help="search algorithm (default: pvs)")
+    args = parser.parse_args()
+
+    input_stream = sys.stdin if args.input == "-" else open(args.input)
+    output_stream = sys.stdout if args.output == "-" else open(args.output, "w")
+    try:
+        analyze_stream(read_records(input_stream), output_stream, args.workers,
+                       args.depth, args.time, args.search)
+    finally:
+        if input_stream is not sys.stdin:
+            input_stream.close()
+        if output_stream is not sys.stdout:
+            output_stream.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+import argparse
+import sys
+
+from analyzer import positive_int
+from connect4pyAivAi import Connect4AIvAI
+
+# Benchmark corpus: move sequences (columns 1-7) played from the empty board
+POSITIONS = [
+    "",
+    "32",
+    "4611",
+    "751351",
+    "52114412",
+    "1541751266",
+    "515541215723",
+    "42515357621556",
+    "4543327267215354",
+    "36435115427324416175",
+]
+
+
+def setup_position(moves):
+    """Create a game with the given move sequence already played"""
+    game = Connect4AIvAI()
+    for move in moves:
+        game.drop_piece(int(move) - 1)
+        game.switch_player()
+    return game
+
+
+def search(moves, depth, search_mode, move_ordering=False):
+    """Search a position and return (column, nodes searched)"""
+    game = setup_position(moves)
+    game.search_mode = search_mode
+    game.move_ordering = move_ordering
+    col = game.get_ai_move(game.current_player, depth)
+    return col, game.nodes_searched
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare nodes searched by alpha-beta and PVS.")
+    parser.add_argument("depth", nargs="?", type=positive_int, default=5, help="search depth (default: 5)")
+    depth = parser.parse_args().depth
+
+    # Both savings are relative to the column on their left: "ordering" is what
+    # centre-out move ordering saves plain alpha-beta, and "pvs" is what null
+    # windows and aspiration save on top of the same ordering.
+    print(f"Alpha-beta vs PVS at depth {depth}")
+    print(f"{'position':<22}{'move':>5}{'alpha-beta':>12}{'ordered':>10}{'ordering':>10}"
+          f"{'pvs':>10}{'pvs':>8}")
+
+    total_ab = 0
+    total_ordered = 0
+    total_pvs = 0
+    for moves in POSITIONS:
+        ab_col, ab_nodes = search(moves, depth, 'alphabeta')
+        _, ordered_nodes = search(moves, depth, 'alphabeta', move_ordering=True)
+        pvs_col, pvs_nodes = search(moves, depth, 'pvs')
+        if ab_col != pvs_col:
+            print(f"Move mismatch at '{moves}': alpha-beta {ab_col + 1}, pvs {pvs_col + 1}")
+            sys.exit(1)
+
+        total_ab += ab_nodes
+        total_ordered += ordered_nodes
+        total_pvs += pvs_nodes
+        print(format_row(moves or '(start)', ab_col + 1, ab_nodes, ordered_nodes, pvs_nodes))
+
+    print(format_row('total', '', total_ab, total_ordered, total_pvs))
+
+
+def format_row(label, move, ab_nodes, ordered_nodes, pvs_nodes):
+    """Format one line of the node-count table"""
+    ordering_saved = 100 * (1 - ordered_nodes / ab_nodes)
+    pvs_saved = 100 * (1 - pvs_nodes / ordered_nodes)
+    return (f"{label:<22}{move:>5}{ab_nodes:>12}{ordered_nodes:>10}{ordering_saved:>9.1f}%"
+            f"{pvs_nodes:>10}{pvs_saved:>7.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,15 @@ import random
 import sys
 import time
 
+from renderer import BoardRenderer, FULL, MODES
+
+TITLE = "    CONNECT 4 - AI vs AI"
+
+
+class SearchTimeout(Exception):
+    """Raised inside a search once its deadline has passed"""
+
+
 class Connect4AIvAI:
     def __init__(self):
         self.rows = 6
@@ -13,26 +22,22 @@ class Connect4AIvAI:
         self.ai1_depth = 4  # AI 1 lookahead depth
         self.ai2_depth = 4  # AI 2 lookahead depth
         self.move_delay = 1  # Delay between moves in seconds
+        self.search_mode = 'alphabeta'  # 'alphabeta' or 'pvs'
+        self.aspiration_window = 100  # Half-width of the PVS aspiration window
+        self.nodes_searched = 0  # Nodes visited by the last search
+        self.move_ordering = False  # Search minimax moves centre-out, as PVS does
+        self.deadline = None  # time.perf_counter() value at which searches abort
+        self.renderers = [BoardRenderer(sys.stdout, title=TITLE, blocking=True)]  # Board output, one per display mode
         
     def display_board(self):
-        print("\n" + "=" * 29)
-        print("    CONNECT 4 - AI vs AI")
-        print("=" * 29)
-        
-        # Display column numbers
-        print("  ", end="")
-        for col in range(self.cols):
-            print(f" {col + 1} ", end="")
-        print()
-        
-        # Display board
-        print("  " + "-" * (self.cols * 4 - 1))
-        for row in range(self.rows):
-            print("  |", end="")
-            for col in range(self.cols):
-                print(f" {self.board[row][col]} |", end="")
-            print()
-            print("  " + "-" * (self.cols * 4 - 1))
+        """Draw the board on every renderer"""
+        for renderer in self.renderers:
+            renderer.render(self.board)
+    
+    def announce(self, text):
+        """Show a message on every renderer"""
+        for renderer in self.renderers:
+            renderer.message(text)
     
     def drop_piece(self, col):
         """Drop a piece in the specified column"""
@@ -183,29 +188,45 @@ class Connect4AIvAI:
             return True
         return False
     
+    def check_deadline(self):
+        """Abort the search with SearchTimeout if the deadline has passed.
+
+        The board is left mid-search, so callers that set a deadline must
+        restore it themselves.
+        """
+        if self.deadline is not None and time.perf_counter() >= self.deadline:
+            raise SearchTimeout()
+    
+    def evaluate_leaf(self, ai_player):
+        """Score a terminal or depth-limited position for ai_player"""
+        if self.is_terminal_state():
+            # Check who won
+            temp_player = self.current_player
+            self.current_player = ai_player
+            if self.check_winner():
+                self.current_player = temp_player
+                return 1000000
+            opponent = self.ai2_player if ai_player == self.ai1_player else self.ai1_player
+            self.current_player = opponent
+            if self.check_winner():
+                self.current_player = temp_player
+                return -1000000
+            self.current_player = temp_player
+            return 0  # Tie
+        # Depth limit reached, evaluate position
+        return self.score_position(ai_player)
+    
     def minimax(self, depth, alpha, beta, maximizing_player, ai_player):
         """Minimax algorithm with alpha-beta pruning"""
+        self.nodes_searched += 1
+        self.check_deadline()
         valid_cols = self.get_valid_columns()
+        if self.move_ordering:
+            valid_cols = self.order_columns(valid_cols)
         
         # Terminal state checks
         if depth == 0 or self.is_terminal_state():
-            if self.is_terminal_state():
-                # Check who won
-                temp_player = self.current_player
-                self.current_player = ai_player
-                if self.check_winner():
-                    self.current_player = temp_player
-                    return (None, 1000000)
-                opponent = self.ai2_player if ai_player == self.ai1_player else self.ai1_player
-                self.current_player = opponent
-                if self.check_winner():
-                    self.current_player = temp_player
-                    return (None, -1000000)
-                self.current_player = temp_player
-                return (None, 0)  # Tie
-            else:
-                # Depth limit reached, evaluate position
-                return (None, self.score_position(ai_player))
+            return (None, self.evaluate_leaf(ai_player))
         
         if maximizing_player:
             value = -sys.maxsize
@@ -263,6 +284,87 @@ class Connect4AIvAI:
             
             return best_col, value
     
+    def pvs(self, depth, alpha, beta, maximizing_player, ai_player):
+        """Principal variation search (negascout) with alpha-beta bounds.
+
+        The first move at each node is searched with the full window and the
+        remaining moves with a null window; a move that fails high is
+        re-searched with the full window.
+        """
+        self.nodes_searched += 1
+        self.check_deadline()
+        valid_cols = self.order_columns(self.get_valid_columns())
+        
+        # Terminal state checks
+        if depth == 0 or self.is_terminal_state():
+            return (None, self.evaluate_leaf(ai_player))
+        
+        opponent = self.ai2_player if ai_player == self.ai1_player else self.ai1_player
+        
+        if maximizing_player:
+            value = -sys.maxsize
+            best_col = random.choice(valid_cols) if valid_cols else None
+            
+            for i, col in enumerate(valid_cols):
+                # Make move
+                row = self.get_next_open_row(col)
+                self.board[row][col] = ai_player
+                self.current_player = opponent
+                
+                # Full window for the first move and for leaves, null window for the rest
+                if i == 0 or depth == 1:
+                    _, score = self.pvs(depth - 1, alpha, beta, False, ai_player)
+                else:
+                    _, score = self.pvs(depth - 1, alpha, alpha + 1, False, ai_player)
+                    if alpha < score < beta:
+                        _, score = self.pvs(depth - 1, score, beta, False, ai_player)
+                
+                # Undo move
+                self.board[row][col] = ' '
+                self.current_player = ai_player
+                
+                if score > value:
+                    value = score
+                    best_col = col
+                
+                alpha = max(alpha, value)
+                if alpha >= beta:
+                    break
+            
+            return best_col, value
+        
+        else:  # Minimizing player
+            value = sys.maxsize
+            best_col = random.choice(valid_cols) if valid_cols else None
+            
+            for i, col in enumerate(valid_cols):
+                # Make move
+                row = self.get_next_open_row(col)
+                self.board[row][col] = opponent
+                self.current_player = ai_player
+                
+                # Full window for the first move and for leaves, null window for the rest
+                if i == 0 or depth == 1:
+                    _, score = self.pvs(depth - 1, alpha, beta, True, ai_player)
+                else:
+                    _, score = self.pvs(depth - 1, beta - 1, beta, True, ai_player)
+                    if alpha < score < beta:
+                        _, score = self.pvs(depth - 1, alpha, score, True, ai_player)
+                
+                # Undo move
+                self.board[row][col] = ' '
+                self.current_player = opponent
+                
+                if score < value:
+                    value = score
+                    best_col = col
+                
+                beta = min(beta, value)
+                if alpha >= beta:
+                    break
+            
+            return best_col, value
+    
     def get_next_open_row(self, col):
         """Get the next open row in a column"""
         for row in range(self.rows - 1, -1, -1):
@@ -271,16 +373,108 @@ class Connect4AIvAI:
         return -1
     
     def get_ai_move(self, ai_player, depth):
-        """Get the AI's move using minimax"""
-        col, _ = self.minimax(depth, -sys.maxsize, sys.maxsize, True, ai_player)
+        """Get the AI's move using the configured search"""
+        self.nodes_searched = 0
+        if self.search_mode == 'pvs':
+            col, _ = self.aspiration_search(ai_player, depth)
+        else:
+            col, _ = self.minimax(depth, -sys.maxsize, sys.maxsize, True, ai_player)
         return col
     
+    def order_columns(self, cols, first_col=None):
+        """Order columns centre-out, optionally trying first_col before the rest"""
+        center_col = self.cols // 2
+        ordered = sorted(cols, key=lambda col: abs(col - center_col))
+        if first_col in ordered:
+            ordered.remove(first_col)
+            ordered.insert(0, first_col)
+        return ordered
+    
+    def pvs_root(self, depth, alpha, beta, ai_player, first_col=None):
+        """Search the root with PVS, breaking ties towards the lowest column.
+
+        Plain alpha-beta keeps the first column (left to right) that reaches
+        the best score, so when a lower column is searched after the current
+        best one its null window is lowered by one to detect an equal score.
+        """
+        self.nodes_searched += 1
+        self.check_deadline()
+        valid_cols = self.order_columns(self.get_valid_columns(), first_col)
+        
+        if depth == 0 or self.is_terminal_state():
+            return (None, self.evaluate_leaf(ai_player))
+        
+        opponent = self.ai2_player if ai_player == self.ai1_player else self.ai1_player
+        value = -sys.maxsize
+        best_col = None
+        
+        for col in valid_cols:
+            # Make move
+            row = self.get_next_open_row(col)
+            self.board[row][col] = ai_player
+            self.current_player = opponent
+            
+            # A lower column than the current best also wins on an equal score
+            tie = best_col is not None and col < best_col
+            if best_col is None or depth == 1:
+                _, score = self.pvs(depth - 1, alpha, beta, False, ai_player)
+            else:
+                low = alpha - 1 if tie else alpha
+                _, score = self.pvs(depth - 1, low, low + 1, False, ai_player)
+                if low < score < beta:
+                    _, score = self.pvs(depth - 1, low, beta, False, ai_player)
+            
+            # Undo move
+            self.board[row][col] = ' '
+            self.current_player = ai_player
+            
+            if score > value or (tie and score == value >= alpha):
+                value = score
+                best_col = col
+            
+            alpha = max(alpha, value)
+            if alpha >= beta:
+                break
+        
+        return best_col, value
+    
+    def aspiration_search(self, ai_player, depth):
+        """Iteratively deepen PVS, centring each window on the last score.
+
+        The evaluation swings between odd and even plies, so the search
+        deepens two plies at a time to keep the previous score comparable.
+        """
+        start = 2 - depth % 2 if depth > 1 else depth
+        for _, col, score in self.iterate_pvs(ai_player, range(start, depth + 1, 2)):
+            pass
+        return col, score
+    
+    def iterate_pvs(self, ai_player, depths):
+        """Search each depth in turn, yielding (depth, column, score) as each finishes.
+
+        The first depth gets a full window and each later one an aspiration
+        window around the previous score, with the previous best move first.
+        """
+        col = None
+        score = None
+        for d in depths:
+            if score is None:
+                col, score = self.pvs_root(d, -sys.maxsize, sys.maxsize, ai_player)
+            else:
+                alpha = score - self.aspiration_window
+                beta = score + self.aspiration_window
+                col, score = self.pvs_root(d, alpha, beta, ai_player, col)
+                # Fell outside the window, re-search with the full window
+                if score <= alpha or score >= beta:
+                    col, score = self.pvs_root(d, -sys.maxsize, sys.maxsize, ai_player, col)
+            yield d, col, score
+    
     def play(self):
         """Main game loop for AI vs AI"""
-        print("\nWelcome to Connect 4 - AI vs AI!")
-        print("AI 1 is Player X (depth: {})".format(self.ai1_depth))
-        print("AI 2 is Player O (depth: {})".format(self.ai2_depth))
-        print("Press Ctrl+C to stop the game\n")
+        self.announce("\nWelcome to Connect 4 - AI vs AI!")
+        self.announce("AI 1 is Player X (depth: {})".format(self.ai1_depth))
+        self.announce("AI 2 is Player O (depth: {})".format(self.ai2_depth))
+        self.announce("Press Ctrl+C to stop the game\n")
         
         move_count = 0
         
@@ -290,30 +484,30 @@ class Connect4AIvAI:
                 
                 # Determine which AI is playing
                 if self.current_player == self.ai1_player:
-                    print(f"\nAI 1 (X) is thinking...")
+                    self.announce(f"\nAI 1 (X) is thinking...")
                     col = self.get_ai_move(self.ai1_player, self.ai1_depth)
                     ai_name = "AI 1 (X)"
                 else:
-                    print(f"\nAI 2 (O) is thinking...")
+                    self.announce(f"\nAI 2 (O) is thinking...")
                     col = self.get_ai_move(self.ai2_player, self.ai2_depth)
                     ai_name = "AI 2 (O)"
                 
                 if col is not None:
                     self.drop_piece(col)
                     move_count += 1
-                    print(f"{ai_name} drops piece in column {col + 1}")
-                    print(f"Move #{move_count}")
+                    self.announce(f"{ai_name} drops piece in column {col + 1}")
+                    self.announce(f"Move #{move_count}")
                     
                     # Check for winner
                     if self.check_winner():
                         self.display_board()
-                        print(f"\n{ai_name} wins after {move_count} moves!")
+                        self.announce(f"\n{ai_name} wins after {move_count} moves!")
                         break
                     
                     # Check for tie
                     if self.is_board_full():
                         self.display_board()
-                        print(f"\nIt's a tie after {move_count} moves! The board is full.")
+                        self.announce(f"\nIt's a tie after {move_count} moves! The board is full.")
                         break
                     
                     # Switch to other AI
@@ -322,12 +516,12 @@ class Connect4AIvAI:
                     # Add delay to make it watchable
                     time.sleep(self.move_delay)
                 else:
-                    print("AI error: No valid moves available")
+                    self.announce("AI error: No valid moves available")
                     break
                     
         except KeyboardInterrupt:
-            print("\n\nGame interrupted by user!")
-            print(f"Game ended after {move_count} moves.")
+            self.announce("\n\nGame interrupted by user!")
+            self.announce(f"Game ended after {move_count} moves.")
     
     def play_with_options(self):
         """Play with customizable options"""
@@ -347,6 +541,13 @@ class Connect4AIvAI:
             delay = input("Enter delay between moves in seconds (default=1): ").strip()
             self.move_delay = float(delay) if delay else 1.0
             
+            search = input("Use principal variation search? (y/n, default=n): ").strip()
+            self.search_mode = 'pvs' if search.lower() == 'y' else 'alphabeta'
+            
+            mode = input("Display mode (full/diff/delta/none, default=full): ").strip().lower()
+            mode = mode if mode in MODES else FULL
+            self.renderers = [BoardRenderer(sys.stdout, mode, title=TITLE, blocking=True)]
+            
         except ValueError:
             print("Invalid input. Using default settings.")
             self.ai1_depth = 4
@@ -358,7 +559,11 @@ class Connect4AIvAI:
 
 def main():
     game = Connect4AIvAI()
-    game.play_with_options()
+    try:
+        game.play_with_options()
+    finally:
+        for renderer in game.renderers:
+            renderer.close()
 
 
 if __name__ == "__main__":
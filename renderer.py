@@ -0,0 +1,270 @@
+import queue
+import threading
+from collections import deque
+
+# Render modes
+FULL = 'full'    # Whole board as plain text, one write per frame
+DIFF = 'diff'    # Whole board once, then only the changed cells via ANSI cursor moves
+DELTA = 'delta'  # Compact line-based updates for programs reading the stream
+NONE = 'none'    # Headless: nothing is formatted or written
+
+MODES = (FULL, DIFF, DELTA, NONE)
+
+
+class StreamWriter:
+    """Write text to a stream or socket from a background thread.
+
+    Writes are queued so a slow reader never blocks the game loop. When the
+    queue is full the text is dropped and `overflowed` is set, so the
+    renderer can send a full frame to bring the reader back in sync. Once
+    the stream fails or the writer is closed, further writes are ignored.
+    """
+
+    def __init__(self, stream, max_pending=256, close_timeout=5.0):
+        self.stream = stream
+        self.overflowed = False
+        self.closed = False
+        self.close_timeout = close_timeout  # Longest close() waits for a slow reader
+        self.queue = queue.Queue(max_pending)
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def write(self, text):
+        """Queue text for writing without blocking"""
+        if self.closed:
+            return
+        try:
+            self.queue.put_nowait(text)
+        except queue.Full:
+            self.overflowed = True
+
+    def close(self):
+        """Flush queued text and stop the writer thread, waiting at most close_timeout"""
+        self.closed = True
+        if not self.thread.is_alive():
+            return
+        try:
+            self.queue.put(None, timeout=self.close_timeout)
+        except queue.Full:
+            # Reader is stuck, leave the daemon thread behind
+            return
+        self.thread.join(self.close_timeout)
+
+    def _run(self):
+        failed = False
+        while True:
+            text = self.queue.get()
+            if text is None:
+                break
+            if failed:
+                continue
+            try:
+                write_to(self.stream, text)
+            except Exception:
+                # Reader went away or the stream was closed; keep draining
+                # the queue so close() never waits on a full queue
+                failed = True
+                self.closed = True
+
+
+def write_to(stream, text):
+    """Write text to a file-like object or a socket"""
+    if hasattr(stream, 'sendall'):
+        stream.sendall(text.encode())
+    else:
+        stream.write(text)
+        stream.flush()
+
+
+class Spectator:
+    """One output stream of a renderer"""
+
+    def __init__(self, stream, blocking=False):
+        self.stream = stream
+        self.writer = None if blocking else StreamWriter(stream)
+        self.failed = False  # A blocking write raised; nothing more is written
+        self.synced = False  # Has been sent a full frame to build on
+
+    def needs_full_frame(self):
+        """Whether this stream must be sent a whole frame rather than a diff"""
+        if self.writer is not None and self.writer.overflowed:
+            # Reader missed some output, start again from a full frame
+            self.writer.overflowed = False
+            self.synced = False
+        return not self.synced
+
+    def is_closed(self):
+        """Whether the stream has failed or been closed"""
+        return self.failed or (self.writer is not None and self.writer.closed)
+
+    def write(self, text):
+        if self.writer is not None:
+            self.writer.write(text)
+            return
+        if self.failed:
+            return
+        try:
+            write_to(self.stream, text)
+        except Exception:
+            # Reader went away; never let that reach the game loop
+            self.failed = True
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+class BoardRenderer:
+    """Render a Connect 4 board to any number of streams in one display mode.
+
+    Each frame and message is formatted once and the same text is written
+    to every stream. Streams that have not seen the board yet, or that
+    dropped output, get a full frame instead of the diff. Streams are
+    written from a background thread unless added with blocking=True, and
+    streams that fail are dropped.
+    """
+
+    def __init__(self, stream=None, mode=FULL, title="      CONNECT 4 GAME", blocking=False, status_lines=4):
+        if mode not in MODES:
+            raise ValueError(f"Unknown render mode: {mode}")
+        self.mode = mode
+        self.title = title
+        self.spectators = []
+        self.last_board = None  # Board as of the last frame written
+        self.status = deque(maxlen=status_lines)  # Recent messages in diff mode
+        if stream is not None:
+            self.add_stream(stream, blocking)
+
+    def add_stream(self, stream, blocking=False):
+        """Start writing to another stream or socket, from the next frame on"""
+        if self.mode != NONE:
+            self.spectators.append(Spectator(stream, blocking))
+
+    def render(self, board):
+        """Draw the board, sending only what changed since the last frame if the mode allows"""
+        if self.mode == NONE or not self.spectators:
+            return
+
+        changes = None
+        if self.mode != FULL and self.last_board is not None and len(self.last_board) == len(board):
+            changes = self.changed_cells(board)
+            # Pieces are never removed during a game, so an emptied cell means a new game
+            if any(piece == ' ' for _, _, piece in changes):
+                changes = None
+
+        full_text = None
+        diff_text = None
+        for spectator in self.spectators:
+            if self.mode == FULL or changes is None or spectator.needs_full_frame():
+                if full_text is None:
+                    full_text = self.format_full(board)
+                spectator.write(full_text)
+                spectator.synced = True
+            elif changes:
+                if diff_text is None:
+                    diff_text = self.format_changes(changes, len(board))
+                spectator.write(diff_text)
+
+        self.last_board = [list(row) for row in board]
+        self._drop_closed()
+
+    def message(self, text):
+        """Show a line of text alongside the board"""
+        if self.mode == NONE or not self.spectators:
+            return
+        if self.mode == FULL:
+            self._broadcast(text + "\n")
+            return
+
+        lines = [line for line in text.split("\n") if line]
+        if self.mode == DELTA:
+            self._broadcast(''.join(f"T {line}\n" for line in lines))
+        else:
+            self.status.extend(lines)
+            if self.last_board is not None:
+                # Streams without a board get the status with their first full frame
+                self._broadcast(self.format_status(), synced_only=True)
+
+    def close(self):
+        """Wait for queued output to be written"""
+        for spectator in self.spectators:
+            spectator.close()
+
+    def format_full(self, board):
+        """Format a whole frame in the current mode"""
+        if self.mode == DIFF:
+            return self.format_diff_frame(board)
+        if self.mode == DELTA:
+            return self.format_delta_frame(board)
+        return self.format_frame(board)
+
+    def format_changes(self, changes, rows):
+        """Format the changed cells in the current mode"""
+        if self.mode == DIFF:
+            return ''.join(self.format_diff_cell(row, col, piece, rows) for row, col, piece in changes)
+        return ''.join(f"M {piece} {row + 1} {col + 1}\n" for row, col, piece in changes)
+
+    def changed_cells(self, board):
+        """List (row, col, piece) for every cell that differs from the last frame"""
+        changes = []
+        for row, (old, new) in enumerate(zip(self.last_board, board)):
+            if old != new:
+                for col, piece in enumerate(new):
+                    if piece != old[col]:
+                        changes.append((row, col, piece))
+        return changes
+
+    def format_frame(self, board):
+        """Format the whole board as plain text"""
+        cols = len(board[0])
+        separator = "  " + "-" * (cols * 4 - 1) + "\n"
+        parts = [
+            "\n" + "=" * 29 + "\n",
+            self.title + "\n",
+            "=" * 29 + "\n",
+            "  " + "".join(f" {col + 1} " for col in range(cols)) + "\n",
+            separator,
+        ]
+        for row in board:
+            parts.append("  |" + "".join(f" {piece} |" for piece in row) + "\n")
+            parts.append(separator)
+        return "".join(parts)
+
+    def format_diff_frame(self, board):
+        """Clear the screen and draw the whole board and status area"""
+        return "\x1b[H\x1b[2J" + self.format_frame(board) + self.format_status(len(board))
+
+    def format_diff_cell(self, row, col, piece, rows):
+        """Move the cursor onto one cell and redraw it"""
+        # The board starts on screen line 7, with a separator between rows
+        return f"\x1b[{7 + 2 * row};{5 + 4 * col}H{piece}" + self._park_cursor(rows)
+
+    def format_status(self, rows=None):
+        """Redraw the status area below the board"""
+        rows = rows if rows is not None else len(self.last_board)
+        top = 8 + 2 * rows
+        parts = []
+        for i in range(self.status.maxlen):
+            line = self.status[i] if i < len(self.status) else ""
+            parts.append(f"\x1b[{top + i};1H\x1b[K{line}")
+        return "".join(parts) + self._park_cursor(rows)
+
+    def format_delta_frame(self, board):
+        """Format the whole board as one line, '.' for empty cells"""
+        cells = "".join(piece if piece != ' ' else '.' for row in board for piece in row)
+        return f"B {len(board)} {len(board[0])} {cells}\n"
+
+    def _park_cursor(self, rows):
+        # Leave the cursor below the status area
+        return f"\x1b[{8 + 2 * rows + self.status.maxlen};1H"
+
+    def _broadcast(self, text, synced_only=False):
+        for spectator in self.spectators:
+            if spectator.synced or not synced_only:
+                spectator.write(text)
+        self._drop_closed()
+
+    def _drop_closed(self):
+        for spectator in [s for s in self.spectators if s.is_closed()]:
+            spectator.close()
+            self.spectators.remove(spectator)